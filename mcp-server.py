@@ -5,121 +5,285 @@ Provides tools for Docker-based CI/CD pipeline, code quality checks, and testing
 """
 
 import asyncio
+import functools
+import hashlib
 import json
+import math
 import os
+import sqlite3
 import subprocess
 import sys
+import threading
 import time
 import yaml
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Awaitable, Callable, ClassVar, Dict, List, Optional, Tuple
 
 import mcp.server.stdio
 import mcp.types as types
 from mcp.server import NotificationOptions, Server, InitializationOptions
 from pydantic import AnyUrl
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:
+    from yaml import SafeLoader as YamlLoader
+
+# orjson parses gh's JSON output straight from bytes; json.loads accepts bytes too
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Docker SDK talks to the daemon socket directly; the CLI probe covers the rest
+try:
+    import docker
+except ImportError:
+    docker = None
+
+# Seconds to reuse Docker / GitHub CLI environment probe results
+ENV_CHECK_TTL = 30.0
+
+# Successful startup probe results stay valid longer, so the first tool call
+# of an interactive session (often minutes after launch) still finds them;
+# failed probes are never cached and re-run on the next tool call
+STARTUP_PROBE_TTL = 300.0
+
+# ASCII-only case folding for command output lines (compiler output is ASCII)
+ASCII_LOWERCASE = bytes.maketrans(bytes(range(0x41, 0x5B)), bytes(range(0x61, 0x7B)))
+
+# Highlight prefixes for command output lines
+SUCCESS_LINE_PREFIX = "✅ ".encode()
+WARNING_LINE_PREFIX = "🟡 ".encode()
+ERROR_LINE_PREFIX = "🔴 ".encode()
+STDERR_LINE_PREFIX = "🔥 ".encode()
+
+# Static report blocks, copied into each tool's output
+WORKFLOW_STATUS_HEADER = ("🔍 GitHub Actions Workflow Status", "=" * 40, "")
+YAML_VALIDATION_HEADER = ("🔍 GitHub Actions YAML Validation", "=" * 40, "")
+YAML_VALIDATION_FOOTER = (
+    "",
+    "💡 Helpful Commands:",
+    "   - Check workflow runs: Use 'check_workflow_runs' MCP tool",
+    "   - GitHub CLI: gh workflow list",
+    "   - GitHub CLI: gh run list --workflow <name>",
+)
+
+# Workflow run icons keyed by (status, conclusion); a None conclusion is the per-status fallback
+WORKFLOW_RUN_ICONS = {
+    ("completed", "success"): "✅",
+    ("completed", "failure"): "❌",
+    ("completed", "cancelled"): "🚫",
+    ("completed", None): "⚠️",
+    ("in_progress", None): "🔄",
+    ("queued", None): "⏳",
+}
+
+# Workflow validation reports persisted across runs, one row per file name.
+# The digest key covers this module's source and the YAML parser, so editing
+# the validation rules or upgrading PyYAML invalidates every stored report.
+VALIDATION_CACHE_PATH = Path(".mcp-cache") / "validation.db"
+VALIDATION_CACHE_KEY = hashlib.blake2b(
+    Path(__file__).read_bytes() + f"\0{yaml.__version__}\0{YamlLoader.__name__}".encode(),
+    digest_size=32
+).digest()
+
+# Longest single output line read from a command (asyncio defaults to 64 KiB)
+STREAM_LINE_LIMIT = 1024 * 1024
+
+
+class ValidationCache:
+    """SQLite store of workflow validation reports, safe to share between threads."""
+    
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self._disabled = False
+    
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the database on first use; disable caching if that fails."""
+        if self._conn is None and not self._disabled:
+            try:
+                self.db_path.parent.mkdir(parents=True, exist_ok=True)
+                conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+                with conn:
+                    # Replaces the old table keyed by digest, which grew on every edit
+                    conn.execute("DROP TABLE IF EXISTS cache")
+                    conn.execute(
+                        "CREATE TABLE IF NOT EXISTS reports "
+                        "(name TEXT PRIMARY KEY, digest BLOB, report TEXT)"
+                    )
+                self._conn = conn
+            except (OSError, sqlite3.Error):
+                # e.g. read-only project mount; validate without caching
+                self._disabled = True
+        return self._conn
+    
+    def load(self) -> Dict[str, Tuple[bytes, Any]]:
+        """Return every stored (digest, report) pair keyed by file name."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return {}
+            try:
+                rows = conn.execute("SELECT name, digest, report FROM reports").fetchall()
+            except sqlite3.Error:
+                return {}
+        return {name: (digest, json.loads(report)) for name, digest, report in rows}
+    
+    def put_many(self, rows: List[Tuple[str, bytes, Any]]) -> None:
+        """Store (name, digest, report) rows in one transaction, replacing older reports."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            try:
+                with conn:
+                    conn.executemany(
+                        "INSERT OR REPLACE INTO reports (name, digest, report) VALUES (?, ?, ?)",
+                        [(name, digest, json.dumps(report)) for name, digest, report in rows]
+                    )
+            except sqlite3.Error:
+                pass
+
 
 class MCPServer:
+    # Docker-backed tools: name -> (command, description, _run_docker_command options)
+    DOCKER_TOOLS: ClassVar[Dict[str, Tuple[str, str, Dict[str, Any]]]] = {
+        # Code Quality Tools
+        "format_check": ("format-check", "Checking C++ code formatting...", {}),
+        "format_fix": ("format-fix", "Auto-fixing C++ formatting...", {}),
+        "lint": ("lint", "Running C++ linting checks...", {}),
+        "analyze": ("analyze", "Running static analysis...", {}),
+        "full_ci": ("ci", "Running complete CI pipeline...", {"timeout": 600}),  # 10 minutes for full CI
+        
+        # MCP Server
+        "start_dev_env": ("up mcp-server -d", "Starting MCP Server...", {"compose_command": True}),
+        "stop_dev_env": ("down", "Stopping MCP Server...", {"compose_command": True}),
+    }
+    
     def __init__(self, project_root: str = None):
         self.project_root = Path(project_root) if project_root else Path.cwd()
+        self._workflows_dir = self.project_root / ".github" / "workflows"
+        self._compose_file = self.project_root / "docker-compose.yml"
+        self._validation_cache = ValidationCache(self.project_root / VALIDATION_CACHE_PATH)
         self.server = Server("mcp-server")
+        self._cache: Dict[str, Tuple[float, asyncio.Future]] = {}
+        self._bootstrap_task: Optional[asyncio.Task] = None
+        self._docker_client = None
         self._setup_tools()
         
     def _setup_tools(self):
-        """Register all MCP tools."""
-        
-        # Code Quality Tools
-        @self.server.call_tool()
-        async def format_check(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Check C++ code formatting using clang-format."""
-            return await self._run_docker_command(
-                "format-check",
-                "Checking C++ code formatting..."
-            )
-        
-        @self.server.call_tool()
-        async def format_fix(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Auto-fix C++ formatting issues using clang-format."""
-            return await self._run_docker_command(
-                "format-fix",
-                "Auto-fixing C++ formatting..."
-            )
-        
-        @self.server.call_tool()
-        async def lint(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Run C++ linting using clang-tidy."""
-            return await self._run_docker_command(
-                "lint",
-                "Running C++ linting checks..."
-            )
-        
-        @self.server.call_tool()
-        async def analyze(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Run static analysis on C++ code using cppcheck."""
-            return await self._run_docker_command(
-                "analyze",
-                "Running static analysis..."
-            )
-        
-        @self.server.call_tool()
-        async def full_ci(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Execute complete CI pipeline."""
-            return await self._run_docker_command(
-                "ci",
-                "Running complete CI pipeline...",
-                timeout=600  # 10 minutes for full CI
-            )
-        
-        # MCP Server
-        @self.server.call_tool()
-        async def start_dev_env(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Start containerized MCP server"""
-            return await self._run_docker_command(
-                "up mcp-server -d",
-                "Starting MCP Server...",
-                compose_command=True
-            )
+        """Register the MCP tool dispatcher."""
+        # The server holds a single call_tool handler that receives the tool name
+        self.server.call_tool()(self._call_tool)
+    
+    async def _call_tool(self, name: str, arguments: Optional[Dict[str, Any]]) -> List[types.TextContent]:
+        """Dispatch an MCP tool call by name."""
+        arguments = arguments or {}
         
-        @self.server.call_tool()
-        async def stop_dev_env(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Stop MCP Server."""
-            return await self._run_docker_command(
-                "down",
-                "Stopping MCP Server...",
-                compose_command=True
-            )
+        if name in self.DOCKER_TOOLS:
+            command, description, options = self.DOCKER_TOOLS[name]
+            if options.get("compose_command"):
+                # Starting/stopping containers changes the Docker environment
+                self._cache.pop("docker", None)
+            return await self._run_docker_command(command, description, **options)
         
         # Utility Tools
-        @self.server.call_tool()
-        async def project_status(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Get current project status and Docker environment info."""
+        if name == "project_status":
             return await self._get_project_status()
         
         # GitHub Actions monitoring tools
-        @self.server.call_tool()
-        async def check_workflow_runs(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Check GitHub Actions workflow runs and status."""
+        if name == "check_workflow_runs":
             limit = arguments.get('limit', 10)
             workflow_name = arguments.get('workflow_name', None)
             return await self._check_workflow_runs(limit, workflow_name)
         
-        @self.server.call_tool()
-        async def validate_workflow_yaml(arguments: Dict[str, Any]) -> List[types.TextContent]:
-            """Validate GitHub Actions workflow YAML files for syntax errors."""
+        if name == "validate_workflow_yaml":
             workflow_file = arguments.get('workflow_file', None)
             return await self._validate_workflow_yaml(workflow_file)
+        
+        return [types.TextContent(type="text", text=f"❌ Unknown tool: {name}")]
+    
+    async def _bootstrap(self) -> None:
+        """Run the environment probes concurrently so early tool calls find them cached."""
+        await asyncio.gather(
+            self._cached("docker", STARTUP_PROBE_TTL, self._validate_docker_environment),
+            self._cached(
+                "gh_auth", STARTUP_PROBE_TTL, self._check_github_auth, keep=itemgetter("authenticated")
+            ),
+            return_exceptions=True
+        )
+    
+    async def _cached(
+        self,
+        key: str,
+        ttl: float,
+        coro_factory: Callable[[], Awaitable[Any]],
+        keep: Callable[[Any], bool] = bool
+    ) -> Any:
+        """Return the cached result for key, running coro_factory once it has expired.
+        
+        Callers arriving while a run is in flight await that run instead of
+        starting another. The ttl counts from when the run finishes, and only
+        results accepted by keep are cached; a failed environment probe is
+        re-run on the next call so fixing the environment takes effect at once.
+        """
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() >= entry[0]:
+            future = asyncio.ensure_future(coro_factory())
+            entry = self._cache[key] = (math.inf, future)
+            future.add_done_callback(functools.partial(self._start_cache_ttl, key, ttl, keep))
+        
+        # Shield so one cancelled caller does not cancel the run for the others
+        return await asyncio.shield(entry[1])
+    
+    def _start_cache_ttl(
+        self,
+        key: str,
+        ttl: float,
+        keep: Callable[[Any], bool],
+        future: asyncio.Future
+    ) -> None:
+        """Start an entry's ttl when its run finishes; failed or rejected runs are not kept."""
+        # Checking exception() also marks it retrieved when every caller has gone
+        failed = future.cancelled() or future.exception() is not None or not keep(future.result())
+        entry = self._cache.get(key)
+        if entry is None or entry[1] is not future:
+            # Invalidated or replaced while running
+            return
+        if failed:
+            del self._cache[key]
+        else:
+            self._cache[key] = (time.monotonic() + ttl, future)
+    
+    async def _spawn(
+        self,
+        cmd: List[str],
+        cwd: Optional[Path] = None
+    ) -> Tuple[bytes, bytes, int]:
+        """Run a short-lived command to completion, returning (stdout, stderr, returncode)."""
+        process = await asyncio.create_subprocess_exec(
+            *cmd,
+            cwd=str(cwd) if cwd is not None else None,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE
+        )
+        stdout, stderr = await process.communicate()
+        return stdout, stderr, process.returncode
     
     async def _check_workflow_runs(self, limit: int = 10, workflow_name: Optional[str] = None) -> List[types.TextContent]:
         """Check GitHub Actions workflow runs and status."""
         try:
-            output_lines = []
-            output_lines.append("🔍 GitHub Actions Workflow Status")
-            output_lines.append("=" * 40)
-            output_lines.append("")
+            output_lines = list(WORKFLOW_STATUS_HEADER)
             
             # Check GitHub authentication first
-            auth_check = await self._check_github_auth()
+            auth_check = await self._cached(
+                "gh_auth", ENV_CHECK_TTL, self._check_github_auth, keep=itemgetter("authenticated")
+            )
             if not auth_check["authenticated"]:
                 output_lines.extend(auth_check["messages"])
                 return [types.TextContent(type="text", text="\n".join(output_lines))]
@@ -132,16 +296,9 @@ class MCPServer:
                 cmd.extend(["--workflow", workflow_name])
             
             try:
-                process = await asyncio.create_subprocess_exec(
-                    *cmd,
-                    cwd=str(self.project_root),
-                    stdout=asyncio.subprocess.PIPE,
-                    stderr=asyncio.subprocess.PIPE
-                )
-                
-                stdout, stderr = await process.communicate()
+                stdout, stderr, returncode = await self._spawn(cmd, cwd=self.project_root)
                 
-                if process.returncode != 0:
+                if returncode != 0:
                     if b"not found" in stderr or b"No workflows found" in stderr:
                         output_lines.append("ℹ️  No workflow runs found")
                         output_lines.append("💡 Check if this repository has GitHub Actions enabled")
@@ -149,8 +306,7 @@ class MCPServer:
                         output_lines.append(f"❌ Error getting workflow runs: {stderr.decode()}")
                     return [types.TextContent(type="text", text="\n".join(output_lines))]
                 
-                import json
-                runs = json.loads(stdout.decode())
+                runs = json_loads(stdout)
                 
                 if not runs:
                     output_lines.append("ℹ️  No workflow runs found")
@@ -159,6 +315,7 @@ class MCPServer:
                 output_lines.append(f"📊 Latest {len(runs)} Workflow Runs:")
                 output_lines.append("")
                 
+                icon_for = WORKFLOW_RUN_ICONS.get
                 for run in runs:
                     status = run.get('status', 'unknown')
                     conclusion = run.get('conclusion', 'unknown')
@@ -169,29 +326,16 @@ class MCPServer:
                     run_id = run.get('databaseId', '')
                     
                     # Format status indicator
-                    if status == 'completed':
-                        if conclusion == 'success':
-                            status_icon = "✅"
-                        elif conclusion == 'failure':
-                            status_icon = "❌"
-                        elif conclusion == 'cancelled':
-                            status_icon = "🚫"
-                        else:
-                            status_icon = "⚠️"
-                    elif status == 'in_progress':
-                        status_icon = "🔄"
-                    elif status == 'queued':
-                        status_icon = "⏳"
-                    else:
-                        status_icon = "❓"
+                    status_icon = icon_for((status, conclusion)) or icon_for((status, None), "❓")
                     
-                    output_lines.append(f"{status_icon} **{name}** ({branch})")
-                    output_lines.append(f"   Status: {status} | Conclusion: {conclusion}")
-                    output_lines.append(f"   Created: {created[:19].replace('T', ' ')}")
-                    output_lines.append(f"   Run ID: {run_id}")
-                    if url:
-                        output_lines.append(f"   URL: {url}")
-                    output_lines.append("")
+                    # One entry per run; the trailing newline leaves a blank line after the join
+                    url_line = f"\n   URL: {url}" if url else ""
+                    output_lines.append(
+                        f"{status_icon} **{name}** ({branch})\n"
+                        f"   Status: {status} | Conclusion: {conclusion}\n"
+                        f"   Created: {created[:19].replace('T', ' ')}\n"
+                        f"   Run ID: {run_id}{url_line}\n"
+                    )
                 
             except FileNotFoundError:
                 output_lines.append("❌ GitHub CLI (gh) not found")
@@ -211,15 +355,10 @@ class MCPServer:
     async def _check_github_auth(self) -> Dict[str, Any]:
         """Check GitHub CLI authentication status."""
         try:
-            # Check if gh CLI is available
-            process = await asyncio.create_subprocess_exec(
-                "gh", "--version",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await process.communicate()
-            
-            if process.returncode != 0:
+            # Check authentication status; a missing gh binary raises FileNotFoundError
+            try:
+                stdout, stderr, returncode = await self._spawn(["gh", "auth", "status"])
+            except FileNotFoundError:
                 return {
                     "authenticated": False,
                     "messages": [
@@ -229,15 +368,7 @@ class MCPServer:
                     ]
                 }
             
-            # Check authentication status
-            process = await asyncio.create_subprocess_exec(
-                "gh", "auth", "status",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            stdout, stderr = await process.communicate()
-            
-            if process.returncode == 0:
+            if returncode == 0:
                 return {
                     "authenticated": True,
                     "messages": ["✅ GitHub CLI authenticated"]
@@ -249,7 +380,6 @@ class MCPServer:
                 ]
                 
                 # Check for GitHub token in environment
-                import os
                 if os.getenv('GITHUB_TOKEN') or os.getenv('GH_TOKEN'):
                     messages.extend([
                         "  1. GITHUB_TOKEN found in environment",
@@ -287,12 +417,9 @@ class MCPServer:
     async def _validate_workflow_yaml(self, workflow_file: Optional[str] = None) -> List[types.TextContent]:
         """Validate GitHub Actions workflow YAML files for syntax errors."""
         try:
-            output_lines = []
-            output_lines.append("🔍 GitHub Actions YAML Validation")
-            output_lines.append("=" * 40)
-            output_lines.append("")
+            output_lines = list(YAML_VALIDATION_HEADER)
             
-            workflows_dir = self.project_root / ".github" / "workflows"
+            workflows_dir = self._workflows_dir
             if not workflows_dir.exists():
                 output_lines.append("❌ No .github/workflows directory found")
                 return [types.TextContent(type="text", text="\n".join(output_lines))]
@@ -304,7 +431,12 @@ class MCPServer:
                     output_lines.append(f"❌ Workflow file not found: {workflow_file}")
                     return [types.TextContent(type="text", text="\n".join(output_lines))]
             else:
-                workflow_files = list(workflows_dir.glob("*.yml")) + list(workflows_dir.glob("*.yaml"))
+                # One directory scan instead of a glob per extension
+                with os.scandir(workflows_dir) as entries:
+                    workflow_files = [
+                        Path(entry.path) for entry in entries
+                        if entry.name.endswith(('.yml', '.yaml')) and entry.is_file()
+                    ]
             
             if not workflow_files:
                 output_lines.append("ℹ️  No workflow files found")
@@ -313,69 +445,20 @@ class MCPServer:
             output_lines.append(f"📋 Validating {len(workflow_files)} workflow file(s):")
             output_lines.append("")
             
-            import yaml
+            # Read and parse files concurrently; results keep input order
+            stored = await asyncio.to_thread(self._validation_cache.load)
+            updates: List[Tuple[str, bytes, Any]] = []
+            results = await asyncio.gather(*(
+                asyncio.to_thread(self._validate_workflow_file, workflow_path, stored, updates)
+                for workflow_path in workflow_files
+            ))
+            if updates:
+                await asyncio.to_thread(self._validation_cache.put_many, updates)
             
             all_valid = True
-            for workflow_path in workflow_files:
-                try:
-                    with open(workflow_path, 'r') as f:
-                        yaml_content = f.read()
-                    
-                    # Parse YAML to check syntax
-                    yaml.safe_load(yaml_content)
-                    
-                    # Basic GitHub Actions structure validation
-                    workflow_data = yaml.safe_load(yaml_content)
-                    validation_errors = []
-                    
-                    # Check required fields
-                    if 'on' not in workflow_data:
-                        validation_errors.append("Missing 'on' trigger definition")
-                    
-                    if 'jobs' not in workflow_data:
-                        validation_errors.append("Missing 'jobs' definition")
-                    
-                    # Check jobs structure
-                    if 'jobs' in workflow_data:
-                        jobs = workflow_data['jobs']
-                        if not isinstance(jobs, dict):
-                            validation_errors.append("'jobs' must be a dictionary")
-                        else:
-                            for job_name, job_data in jobs.items():
-                                if not isinstance(job_data, dict):
-                                    validation_errors.append(f"Job '{job_name}' must be a dictionary")
-                                    continue
-                                
-                                if 'runs-on' not in job_data:
-                                    validation_errors.append(f"Job '{job_name}' missing 'runs-on'")
-                                
-                                # Check container usage
-                                if 'container' in job_data:
-                                    container = job_data['container']
-                                    if isinstance(container, dict) and 'image' not in container:
-                                        validation_errors.append(f"Job '{job_name}' container missing 'image'")
-                    
-                    # Check for common issues in containerized workflows
-                    yaml_str = yaml_content.lower()
-                    if 'runs-on: self-hosted' in yaml_str and 'container:' not in yaml_str:
-                        validation_errors.append("Self-hosted runner without container specification")
-                    
-                    if validation_errors:
-                        output_lines.append(f"⚠️  {workflow_path.name}:")
-                        for error in validation_errors:
-                            output_lines.append(f"   - {error}")
-                        all_valid = False
-                    else:
-                        output_lines.append(f"✅ {workflow_path.name}: Valid")
-                    
-                except yaml.YAMLError as e:
-                    output_lines.append(f"❌ {workflow_path.name}: YAML syntax error")
-                    output_lines.append(f"   Error: {str(e)}")
-                    all_valid = False
-                except Exception as e:
-                    output_lines.append(f"❌ {workflow_path.name}: Validation error")
-                    output_lines.append(f"   Error: {str(e)}")
-                    all_valid = False
+            for is_valid, file_lines in results:
+                output_lines.extend(file_lines)
+                all_valid = all_valid and is_valid
             
             output_lines.append("")
             if all_valid:
@@ -383,11 +466,7 @@ class MCPServer:
             else:
                 output_lines.append("⚠️  Some workflow files have issues that need attention")
             
-            output_lines.append("")
-            output_lines.append("💡 Helpful Commands:")
-            output_lines.append("   - Check workflow runs: Use 'check_workflow_runs' MCP tool")
-            output_lines.append("   - GitHub CLI: gh workflow list")
-            output_lines.append("   - GitHub CLI: gh run list --workflow <name>")
+            output_lines.extend(YAML_VALIDATION_FOOTER)
             
             return [types.TextContent(type="text", text="\n".join(output_lines))]
             
@@ -397,6 +476,102 @@ class MCPServer:
                 text=f"❌ Error validating workflow YAML: {str(e)}"
             )]
     
+    def _validate_workflow_file(
+        self,
+        workflow_path: Path,
+        stored: Dict[str, Tuple[bytes, Any]],
+        updates: List[Tuple[str, bytes, Any]]
+    ) -> Tuple[bool, List[str]]:
+        """Validate a single workflow file, returning (is_valid, report lines).
+        
+        The stored report is reused when the file is unchanged; otherwise the
+        new report is appended to updates for the caller to save.
+        """
+        try:
+            yaml_content = workflow_path.read_bytes()
+        except Exception as e:
+            return False, [
+                f"❌ {workflow_path.name}: Validation error",
+                f"   Error: {str(e)}"
+            ]
+        
+        # Unchanged files reuse their stored report and skip YAML parsing
+        name = workflow_path.name
+        digest = hashlib.blake2b(yaml_content, digest_size=16, key=VALIDATION_CACHE_KEY).digest()
+        
+        cached = stored.get(name)
+        if cached is not None and cached[0] == digest:
+            is_valid, output_lines = cached[1]
+            return is_valid, output_lines
+        
+        is_valid, output_lines = self._build_workflow_report(name, yaml_content)
+        updates.append((name, digest, [is_valid, output_lines]))
+        return is_valid, output_lines
+    
+    def _build_workflow_report(self, name: str, yaml_content: bytes) -> Tuple[bool, List[str]]:
+        """Parse and check workflow content, returning (is_valid, report lines)."""
+        output_lines = []
+        try:
+            # Parse YAML once; syntax errors surface as yaml.YAMLError
+            workflow_data = yaml.load(yaml_content, Loader=YamlLoader)
+            
+            validation_errors = self._workflow_structure_errors(workflow_data)
+            
+            # Check for common issues in containerized workflows
+            yaml_str = yaml_content.lower()
+            if b'runs-on: self-hosted' in yaml_str and b'container:' not in yaml_str:
+                validation_errors.append("Self-hosted runner without container specification")
+            
+            if validation_errors:
+                output_lines.append(f"⚠️  {name}:")
+                for error in validation_errors:
+                    output_lines.append(f"   - {error}")
+                return False, output_lines
+            
+            output_lines.append(f"✅ {name}: Valid")
+            return True, output_lines
+            
+        except yaml.YAMLError as e:
+            output_lines.append(f"❌ {name}: YAML syntax error")
+            output_lines.append(f"   Error: {str(e)}")
+        except Exception as e:
+            output_lines.append(f"❌ {name}: Validation error")
+            output_lines.append(f"   Error: {str(e)}")
+        return False, output_lines
+    
+    def _workflow_structure_errors(self, workflow_data: Any) -> List[str]:
+        """Collect every structural problem in parsed workflow data."""
+        validation_errors = []
+        
+        # Check required fields
+        if 'on' not in workflow_data:
+            validation_errors.append("Missing 'on' trigger definition")
+        
+        if 'jobs' not in workflow_data:
+            validation_errors.append("Missing 'jobs' definition")
+        
+        # Check jobs structure
+        if 'jobs' in workflow_data:
+            jobs = workflow_data['jobs']
+            if not isinstance(jobs, dict):
+                validation_errors.append("'jobs' must be a dictionary")
+            else:
+                for job_name, job_data in jobs.items():
+                    if not isinstance(job_data, dict):
+                        validation_errors.append(f"Job '{job_name}' must be a dictionary")
+                        continue
+                    
+                    if 'runs-on' not in job_data:
+                        validation_errors.append(f"Job '{job_name}' missing 'runs-on'")
+                    
+                    # Check container usage
+                    if 'container' in job_data:
+                        container = job_data['container']
+                        if isinstance(container, dict) and 'image' not in container:
+                            validation_errors.append(f"Job '{job_name}' container missing 'image'")
+        
+        return validation_errors
+    
     async def _run_docker_command(
         self, 
         command: str, 
@@ -407,7 +582,7 @@ class MCPServer:
         """Execute Docker command with proper error handling and formatting."""
         try:
             # Validate Docker environment
-            if not await self._validate_docker_environment():
+            if not await self._cached("docker", ENV_CHECK_TTL, self._validate_docker_environment):
                 return [types.TextContent(
                     type="text",
                     text="❌ Docker environment validation failed. Please ensure Docker is running and docker-compose.yml exists."
@@ -422,27 +597,44 @@ class MCPServer:
             
             start_time = time.time()
             
-            # Execute command
+            # Execute command, formatting output line by line as it arrives
             process = await asyncio.create_subprocess_exec(
                 *cmd,
                 cwd=str(self.project_root),
                 stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
+                stderr=asyncio.subprocess.PIPE,
+                limit=STREAM_LINE_LIMIT
             )
             
+            stdout_lines: List[bytes] = []
+            stderr_lines: List[bytes] = []
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), 
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        self._consume_stream(process.stdout, stdout_lines, self._format_command_line),
+                        self._consume_stream(process.stderr, stderr_lines, self._format_error_line),
+                        process.wait()
+                    ),
                     timeout=timeout
                 )
             except asyncio.TimeoutError:
-                process.kill()
                 return [types.TextContent(
                     type="text",
                     text=f"❌ Command timed out after {timeout} seconds: {' '.join(cmd)}"
                 )]
+            finally:
+                # Timeouts, reader errors and cancellation must not leave the
+                # child running with nobody draining its pipes
+                if process.returncode is None:
+                    try:
+                        process.kill()
+                    except ProcessLookupError:
+                        pass
+                    await process.wait()
             
             execution_time = time.time() - start_time
+            stdout = b'\n'.join(stdout_lines).strip().decode(errors="replace")
+            stderr = b'\n'.join(stderr_lines).decode(errors="replace")
             
             # Format output
             output_lines = []
@@ -455,15 +647,15 @@ class MCPServer:
                 output_lines.append("✅ Success!")
                 if stdout:
                     output_lines.append("📄 Output:")
-                    output_lines.append(self._format_command_output(stdout.decode()))
+                    output_lines.append(stdout)
             else:
                 output_lines.append(f"❌ Failed with exit code {process.returncode}")
                 if stderr:
                     output_lines.append("🔥 Error output:")
-                    output_lines.append(self._format_error_output(stderr.decode()))
+                    output_lines.append(stderr)
                 if stdout:
                     output_lines.append("📄 Standard output:")
-                    output_lines.append(self._format_command_output(stdout.decode()))
+                    output_lines.append(stdout)
             
             return [types.TextContent(
                 type="text",
@@ -480,22 +672,29 @@ class MCPServer:
         """Validate Docker environment and project structure."""
         try:
             # Check if docker-compose.yml exists
-            compose_file = self.project_root / "docker-compose.yml"
-            if not compose_file.exists():
+            if not self._compose_file.exists():
                 return False
             
-            # Check if Docker daemon is running
-            result = await asyncio.create_subprocess_exec(
-                "docker", "ps",
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE
-            )
-            await result.communicate()
-            return result.returncode == 0
+            # Check if Docker daemon is running; the SDK only reads DOCKER_HOST,
+            # so fall back to the CLI, which honours docker contexts
+            if docker is not None and await asyncio.to_thread(self._ping_docker_daemon):
+                return True
+            
+            _, _, returncode = await self._spawn(["docker", "ps"])
+            return returncode == 0
             
         except Exception:
             return False
     
+    def _ping_docker_daemon(self) -> bool:
+        """Ping the Docker daemon through the SDK, reusing one client."""
+        try:
+            if self._docker_client is None:
+                self._docker_client = docker.from_env()
+            return self._docker_client.ping()
+        except Exception:
+            self._docker_client = None
+            return False
     
     async def _validate_test_structure(self) -> List[types.TextContent]:
         """Validate test_cases/ directory structure and YAML files."""
@@ -521,13 +720,15 @@ class MCPServer:
             valid_yaml = []
             invalid_yaml = []
             
-            for yaml_file in yaml_files:
-                try:
-                    with open(yaml_file, 'r') as f:
-                        yaml.safe_load(f)
+            errors = await asyncio.gather(*(
+                asyncio.to_thread(self._check_yaml_file, yaml_file)
+                for yaml_file in yaml_files
+            ))
+            for yaml_file, error in zip(yaml_files, errors):
+                if error is None:
                     valid_yaml.append(yaml_file.name)
-                except Exception as e:
-                    invalid_yaml.append(f"{yaml_file.name}: {str(e)}")
+                else:
+                    invalid_yaml.append(f"{yaml_file.name}: {error}")
             
             if valid_yaml:
                 output_lines.append(f"✅ Valid YAML files ({len(valid_yaml)}):")
@@ -562,6 +763,14 @@ class MCPServer:
                 text=f"❌ Error validating test structure: {str(e)}"
             )]
     
+    def _check_yaml_file(self, yaml_file: Path) -> Optional[str]:
+        """Parse a YAML file, returning the error message if it is invalid."""
+        try:
+            yaml.load(yaml_file.read_bytes(), Loader=YamlLoader)
+            return None
+        except Exception as e:
+            return str(e)
+    
     async def _get_project_status(self) -> List[types.TextContent]:
         """Get current project status and environment info."""
         try:
@@ -571,7 +780,7 @@ class MCPServer:
             output_lines.append("")
             
             # Check Docker environment
-            docker_status = await self._validate_docker_environment()
+            docker_status = await self._cached("docker", ENV_CHECK_TTL, self._validate_docker_environment)
             output_lines.append(f"🐳 Docker: {'✅ Available' if docker_status else '❌ Not available'}")
 
             return [types.TextContent(
@@ -585,39 +794,70 @@ class MCPServer:
                 text=f"❌ Error getting project status: {str(e)}"
             )]
     
-    def _format_command_output(self, output: str) -> str:
-        """Format command output with syntax highlighting for C++ errors."""
-        lines = output.strip().split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            # Highlight success messages
-            if any(word in line.lower() for word in ['success', 'passed', 'complete']):
-                formatted_lines.append(f"✅ {line}")
-            elif any(word in line.lower() for word in ['warning']):
-                formatted_lines.append(f"🟡 {line}")
-            elif any(word in line.lower() for word in ['error']):
-                formatted_lines.append(f"🔴 {line}")
-            else:
-                formatted_lines.append(line)
+    async def _consume_stream(
+        self,
+        stream: asyncio.StreamReader,
+        lines: List[bytes],
+        formatter: Callable[[bytes], Optional[bytes]]
+    ) -> None:
+        """Read a process stream line by line, collecting formatted lines.
         
-        return '\n'.join(formatted_lines)
+        Lines longer than the stream limit are split into limit-sized pieces
+        instead of aborting the read.
+        """
+        append = lines.append
+        overlong = False
+        while True:
+            try:
+                raw_line = await stream.readuntil(b'\n')
+            except asyncio.IncompleteReadError as e:
+                # EOF; keep a final line that has no trailing newline
+                raw_line = e.partial
+                if not raw_line:
+                    break
+            except asyncio.LimitOverrunError as e:
+                # Take the buffered part of the overlong line as its own line
+                piece = await stream.read(e.consumed)
+                line = formatter(piece)
+                if line is not None:
+                    append(line)
+                overlong = True
+                continue
+            
+            if overlong and raw_line == b'\n':
+                # Terminator of an overlong line already emitted in pieces
+                overlong = False
+                continue
+            overlong = False
+            
+            line = formatter(raw_line.rstrip(b'\n'))
+            if line is not None:
+                append(line)
     
-    def _format_error_output(self, output: str) -> str:
-        """Format error output with highlighting."""
-        lines = output.strip().split('\n')
-        formatted_lines = []
-        
-        for line in lines:
-            if line.strip():
-                formatted_lines.append(f"🔥 {line}")
-        
-        return '\n'.join(formatted_lines)
+    def _format_command_line(self, line: bytes) -> bytes:
+        """Format a command output line with syntax highlighting for C++ errors."""
+        # bytes.find outpaces both a keyword regex and the 'in' operator here
+        lowered = line.translate(ASCII_LOWERCASE)
+        if lowered.find(b'success') >= 0 or lowered.find(b'passed') >= 0 or lowered.find(b'complete') >= 0:
+            return SUCCESS_LINE_PREFIX + line
+        if lowered.find(b'warning') >= 0:
+            return WARNING_LINE_PREFIX + line
+        if lowered.find(b'error') >= 0:
+            return ERROR_LINE_PREFIX + line
+        return line
+    
+    def _format_error_line(self, line: bytes) -> Optional[bytes]:
+        """Format an error output line with highlighting, dropping blank lines."""
+        if line.strip():
+            return STDERR_LINE_PREFIX + line
+        return None
     
     def run(self):
         """Run the MCP server."""
         async def main():
             async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
+                # Probe in the background; the initialize handshake does not wait for it
+                self._bootstrap_task = asyncio.create_task(self._bootstrap())
                 await self.server.run(
                     read_stream,
                     write_stream,